@@ -5,12 +5,17 @@ from ..fileio.PNGfile      import *
 from ..utility.static_vars import *
 
 
-@static_vars(cdata=dict())
-def palette(name, device='cuda:0'):
+@static_vars(cdata=dict(), cache=dict())
+def palette(name, device='cuda:0', dtype=torch.float):
     """
     Returns the color palette with the specified name
 
-    The color palettes are contained in the color/asset folder
+    The color palettes are contained in the color/asset folder.
+    Each palette is read from disk only once and kept as a uint8 CPU master
+    copy (3 bytes per color instead of 12); the per-device tensors are cached
+    as well, so repeated calls perform no file I/O and no host to device
+    transfer. Requesting torch.uint8 returns the raw [0,255] colors, any other
+    dtype returns values in [0,1].
 
     Parameters
     ----------
@@ -18,6 +23,8 @@ def palette(name, device='cuda:0'):
         the name of the color palette
     device : str or torch.device (optional)
         the device the tensor will be stored to (default is 'cuda:0')
+    dtype : type (optional)
+        the dtype of the output tensor (default is torch.float)
 
     Returns
     -------
@@ -36,8 +43,17 @@ def palette(name, device='cuda:0'):
                     if os.path.isfile(os.path.join(path, f)) and f.endswith('.png')]
         if name not in filename:
             raise RuntimeError('Palette \'{}\' not present. Choose one from the following:\n{}'.format(name, '\n'.join(filename)))
-        palette.cdata[name] = import_PNG(os.path.join(path, name + '.png'), device=device).squeeze()
-    return palette.cdata[name]
+        cdata = (import_PNG(os.path.join(path, name + '.png'), device='cpu').squeeze() * 255).round().to(torch.uint8)
+        if torch.cuda.is_available():
+            cdata = cdata.pin_memory()
+        palette.cdata[name] = cdata
+    key = (name, str(device), dtype)
+    if key not in palette.cache:
+        cdata = palette.cdata[name].to(device, non_blocking=True)
+        if dtype != torch.uint8:
+            cdata = cdata.to(dtype).div_(255)
+        palette.cache[key] = cdata
+    return palette.cache[key]
 
 
 def save_palette(name, cdata):
@@ -1,3 +1,4 @@
+import warnings
 from ..utility.islist    import *
 from ..utility.isstring  import *
 from ..layer.Concatenate import *
@@ -13,8 +14,8 @@ class HookLayer(torch.nn.Module):
     ----------
     layer : torch.nn.Module
         the layer to evaluate
-    __hook__ : DeferredHook
-        a hook to another layer
+    _hooks : torch.nn.ModuleDict
+        the hooks to other layers
 
     Methods
     -------
@@ -40,7 +41,8 @@ class HookLayer(torch.nn.Module):
 
         super(HookLayer, self).__init__()
         self.add_module('layer', layer)
-        self.__hook__ = {}
+        self._hooks     = torch.nn.ModuleDict()
+        self._hook_list = []
         self.bind(hook_layer)
 
     def is_bound(self):
@@ -53,7 +55,7 @@ class HookLayer(torch.nn.Module):
             True if the layer is bound to another layer, False otherwise
         """
 
-        return all([h.is_bound() for h in self.__hook__.values()])
+        return all([h.is_bound() for h in self._hooks.values()])
 
     def bind(self, layer):
         """
@@ -74,8 +76,9 @@ class HookLayer(torch.nn.Module):
         if not islist(hook):
             hook = [hook]
         for h in hook:
-            name = 'hook_{}'.format(len(self.__hook__))
-            self.__hook__[name] = DeferredHook(layer=h, name=name)
+            name = 'hook_{}'.format(len(self._hooks))
+            self._hooks[name] = DeferredHook(layer=h, name=name)
+        self._hook_list = list(self._hooks.values())
         return self
 
     def unbind(self, i=None):
@@ -94,11 +97,12 @@ class HookLayer(torch.nn.Module):
         """
 
         if i is None:
-            i = list(range(len(self.__hook__)))
+            i = list(range(len(self._hooks)))
         for ii in i:
             key = 'hook_{}'.format(ii)
-            self.__hook__[key].unbind()
-            del self.__hook__[key]
+            self._hooks[key].unbind()
+            del self._hooks[key]
+        self._hook_list = list(self._hooks.values())
         return self
 
     def forward(self, *args, **kwargs):
@@ -118,14 +122,28 @@ class HookLayer(torch.nn.Module):
             the output of the HookLayer
         """
 
-        return self.layer(*tuple(h.output for h in self.__hook__.values()), *args, **kwargs)
+        if not self._hook_list:
+            return self.layer(*args, **kwargs)
+        return self.layer(*(h.output for h in self._hook_list), *args, **kwargs)
 
 
 class ResidualLayer(HookLayer):
     """
     A class representing a residual layer.
+
+    Attributes
+    ----------
+    SCRIPT : bool
+        class-level flag. If True the inner layer is compiled with
+        torch.jit.script, removing the per-call Python dispatch. The
+        aggregation layers take a variable number of inputs, which
+        TorchScript rejects, so they always run eagerly; layers that fail
+        to script fall back to eager with a warning. Opt-in since not
+        every layer is scriptable (default is False)
     """
 
+    SCRIPT = False
+
     def __init__(self, layer, operation='cat', dim=1, **kwargs):
         """
         Parameters
@@ -142,25 +160,33 @@ class ResidualLayer(HookLayer):
         """
 
         fun = {
-            'cat':  lambda x: torch.nn.Sequential(Concatenate(dim=dim), x),
-            'add':  lambda x: torch.nn.Sequential(AddLayer(dim=dim), x),
-            'mean': lambda x: torch.nn.Sequential(MeanLayer(dim=dim), x),
-            'min':  lambda x: torch.nn.Sequential(MinLayer(dim=dim), x),
-            'max':  lambda x: torch.nn.Sequential(MaxLayer(dim=dim), x),
-            'std':  lambda x: torch.nn.Sequential(StdLayer(dim=dim), x),
+            'cat':  lambda: Concatenate(dim=dim),
+            'add':  lambda: AddLayer(dim=dim),
+            'mean': lambda: MeanLayer(dim=dim),
+            'min':  lambda: MinLayer(dim=dim),
+            'max':  lambda: MaxLayer(dim=dim),
+            'std':  lambda: StdLayer(dim=dim),
         }
 
         if isstring(operation):
             if operation.lower() in fun:
-                l = fun[operation.lower()](layer)
+                aggr = fun[operation.lower()]()
             else:
                 raise ValueError('Input operation must be one of the following:\n{}'.format('\n'.join(['cat', 'add', 'mean', 'min', 'max' or 'std'])))
         else:
             if callable(operation):
-                l = torch.nn.Sequential(Aggregation(operation, dim=dim), layer)
+                aggr = Aggregation(operation, dim=dim)
             else:
                 raise ValueError('Input operation must be either a valid function or a string')
-        super(ResidualLayer, self).__init__(l, **kwargs)
+        if self.SCRIPT:
+            # the aggregation takes *inputs, which TorchScript rejects:
+            # only the inner layer is compiled
+            try:
+                layer = torch.jit.script(layer)
+            except Exception as err:
+                warnings.warn('ResidualLayer.SCRIPT: {} is not scriptable, running eagerly ({})'.format(
+                    type(layer).__name__, err), RuntimeWarning)
+        super(ResidualLayer, self).__init__(torch.nn.Sequential(aggr, layer), **kwargs)
 
     def __repr__(self):
         return strrep(self.layer.__repr__(), 'Sequential', 'ResidualLayer')
@@ -236,7 +262,7 @@ class GResidualLayer(HookLayer):
             the layer output
         """
 
-        y = self.aggr(*tuple(h.output for h in self.__hook__.values()), x)
+        y = self.aggr(*(h.output for h in self._hook_list), x)
         return self.layer(y, *args, **kwargs)
 
     def __repr__(self):
@@ -1,75 +1,155 @@
-from .AbstractImplicitSurface import *
-from .acos               import *
-from .affine2linear      import *
-from .affine2rotation    import *
-from .affine2rotm        import *
-from .affine2scaling     import *
-from .affine2translation import *
-from .angle              import *
-from .axang2rotm         import *
-from .axis               import *
-from .barrier_function   import *
-from .cart2homo          import *
-from .cart2pol           import *
-from .cart2sph           import *
-from .constant           import *
-from .cos                import *
-from .cot                import *
-from .cross              import *
-from .deg2rad            import *
-from .demean             import *
-from .diag               import *
-from .dot                import *
-from .dualquat_imag      import *
-from .dualquat_real      import *
-from .eul2rotm           import *
-from .eye                import *
-from .fibonacci          import *
-from .floor              import *
-from .homo2cart          import *
-from .knn                import *
-from .linear2affine      import *
-from .linint             import *
-from .norm               import *
-from .normalize          import *
-from .normvec            import *
-from .perturb            import *
-from .pol2cart           import *
-from .prepare_broadcast  import *
-from .quantize           import *
-from .quat2rotm          import *
-from .quat_conj          import *
-from .quat_eye           import *
-from .quat_inv           import *
-from .quat_multiply      import *
-from .quat_norm          import *
-from .quat_rotate        import *
-from .quat_scalar        import *
-from .quat_vector        import *
-from .rad2deg            import *
-from .randrotm           import *
-from .Range              import *
-from .ratio              import *
-from .rescale            import *
-from .rot_x              import *
-from .rot_y              import *
-from .rot_z              import *
-from .rot2               import *
-from .rotm2affine        import *
-from .sawtooth           import *
-from .sca3               import *
-from .signed_angle       import *
-from .sin                import *
-from .spdiag             import *
-from .speye              import *
-from .sph2cart           import *
-from .sph2rotm           import *
-from .spzeros            import *
-from .standardize        import *
-from .tan                import *
-from .tra3               import *
-from .triharmonic_rbf    import *
-from .unitvec            import *
-from .vec2quat           import *
-from .unrooted_norm      import *
-from .wendland_rbf       import *
+"""
+Lazily loaded math package (PEP 562)
+
+Submodules are imported on first attribute access instead of eagerly at
+package import, so importing ACME.math costs nothing until a function is
+actually used. Attribute access goes through a module subclass, so a
+submodule sharing the name of its function (norm, cos, cross, ...) can
+never shadow the function once the import machinery binds the module
+object onto the package
+"""
+
+import importlib
+import sys
+import types
+
+# public name -> defining submodule
+_LAZY = {
+    'AbstractImplicitSurface': 'AbstractImplicitSurface',
+    'acos'                   : 'acos',
+    'affine2linear'          : 'affine2linear',
+    'affine2rotation'        : 'affine2rotation',
+    'affine2rotm'            : 'affine2rotm',
+    'affine2scaling'         : 'affine2scaling',
+    'affine2translation'     : 'affine2translation',
+    'angle'                  : 'angle',
+    'axang2rotm'             : 'axang2rotm',
+    'x_axis'                 : 'axis',
+    'y_axis'                 : 'axis',
+    'z_axis'                 : 'axis',
+    'w_axis'                 : 'axis',
+    'barrier_function'       : 'barrier_function',
+    'cart2homo'              : 'cart2homo',
+    'cart2pol'               : 'cart2pol',
+    'cart2sph'               : 'cart2sph',
+    'SQRT2'                  : 'constant',
+    'SQRT3'                  : 'constant',
+    'SQRT5'                  : 'constant',
+    'SQRT6'                  : 'constant',
+    'PI'                     : 'constant',
+    'PI2'                    : 'constant',
+    'PI4'                    : 'constant',
+    'PI_2'                   : 'constant',
+    'PI_3'                   : 'constant',
+    'PI_4'                   : 'constant',
+    'PI_6'                   : 'constant',
+    'PI_8'                   : 'constant',
+    'PI_16'                  : 'constant',
+    'Exp'                    : 'constant',
+    'cos'                    : 'cos',
+    'cot'                    : 'cot',
+    'cross'                  : 'cross',
+    'deg2rad'                : 'deg2rad',
+    'demean'                 : 'demean',
+    'diag'                   : 'diag',
+    'dot'                    : 'dot',
+    'dq_imag'                : 'dualquat_imag',
+    'dualquat_real'          : 'dualquat_real',
+    'eul2rotm'               : 'eul2rotm',
+    'eye'                    : 'eye',
+    'eye_like'               : 'eye',
+    'n_bonacci'              : 'fibonacci',
+    'fibonacci'              : 'fibonacci',
+    'floor'                  : 'floor',
+    'homo2cart'              : 'homo2cart',
+    'knn'                    : 'knn',
+    'linear2affine'          : 'linear2affine',
+    'linint'                 : 'linint',
+    'pnorm'                  : 'norm',
+    'norm'                   : 'norm',
+    'hypot'                  : 'norm',
+    'distance'               : 'norm',
+    'hausdorff'              : 'norm',
+    'normalize'              : 'normalize',
+    'normvec'                : 'normvec',
+    'normr'                  : 'normvec',
+    'normc'                  : 'normvec',
+    'normd'                  : 'normvec',
+    'perturb'                : 'perturb',
+    'pol2cart'               : 'pol2cart',
+    'prepare_broadcast'      : 'prepare_broadcast',
+    'quantize'               : 'quantize',
+    'quat2rotm'              : 'quat2rotm',
+    'quat_conj'              : 'quat_conj',
+    'quat_eye'               : 'quat_eye',
+    'quat_inv'               : 'quat_inv',
+    'quat_multiply'          : 'quat_multiply',
+    'quat_norm'              : 'quat_norm',
+    'quat_rotate'            : 'quat_rotate',
+    'quat_scalar'            : 'quat_scalar',
+    'quat_vector'            : 'quat_vector',
+    'rad2deg'                : 'rad2deg',
+    'randrotm'               : 'randrotm',
+    'Range'                  : 'Range',
+    'ratio'                  : 'ratio',
+    'golden_ratio'           : 'ratio',
+    'silver_ratio'           : 'ratio',
+    'bronze_ratio'           : 'ratio',
+    'rescale'                : 'rescale',
+    'rot_x'                  : 'rot_x',
+    'rot_y'                  : 'rot_y',
+    'rot_z'                  : 'rot_z',
+    'rot2'                   : 'rot2',
+    'rotm2affine'            : 'rotm2affine',
+    'sawtooth'               : 'sawtooth',
+    'sca3'                   : 'sca3',
+    'signed_angle'           : 'signed_angle',
+    'sin'                    : 'sin',
+    'spdiag'                 : 'spdiag',
+    'speye'                  : 'speye',
+    'speye_like'             : 'speye',
+    'sph2cart'               : 'sph2cart',
+    'sph2rotm'               : 'sph2rotm',
+    'spzeros'                : 'spzeros',
+    'standardize'            : 'standardize',
+    'tan'                    : 'tan',
+    'tra3'                   : 'tra3',
+    'triharmonic_rbf'        : 'triharmonic_rbf',
+    'unitvec'                : 'unitvec',
+    'vec2quat'               : 'vec2quat',
+    'unrooted_norm'          : 'unrooted_norm',
+    'sqnorm'                 : 'unrooted_norm',
+    'sqdistance'             : 'unrooted_norm',
+    'Wendland_rbf'           : 'wendland_rbf',
+}
+
+__all__ = list(_LAZY)
+
+
+class _LazyModule(types.ModuleType):
+    """
+    A module type resolving the public names through _LAZY
+
+    Importing a submodule binds the module object onto the package under
+    the submodule name; for every function named like its module that
+    binding would shadow the function and PEP 562 __getattr__ would never
+    fire again. Routing __getattribute__ through _LAZY guarantees a public
+    name always resolves to the attribute of its defining submodule
+    """
+
+    def __getattribute__(self, name):
+        if name in _LAZY:
+            d = types.ModuleType.__getattribute__(self, '__dict__')
+            value = d.get(name)
+            if value is None or isinstance(value, types.ModuleType):
+                value = getattr(importlib.import_module('.' + _LAZY[name], d['__name__']), name)
+                d[name] = value
+            return value
+        return types.ModuleType.__getattribute__(self, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+sys.modules[__name__].__class__ = _LazyModule
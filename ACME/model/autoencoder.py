@@ -17,9 +17,11 @@ class AutoEncoder(Model):
     -------
     forward(x)
         returns the autoencoder output
+    enable_cuda_graph(x)
+        captures the forward pass in a CUDA graph for fixed-shape inference
     """
 
-    def __init__(self, encoder, decoder, name='AutoEncoder', **kwargs):
+    def __init__(self, encoder, decoder, name='AutoEncoder', compile=False, **kwargs):
         """
         Parameters
         ----------
@@ -29,11 +31,66 @@ class AutoEncoder(Model):
             the decoder architecture
         name : str (optional)
             the name of the autoencoder (default is 'AutoEncoder')
+        compile : bool (optional)
+            if True wraps encoder and decoder with torch.compile,
+            fusing their elementwise ops into single kernels (default is False)
         """
 
         super(AutoEncoder, self).__init__(name=name, **kwargs)
+        if compile:
+            encoder = torch.compile(encoder)
+            decoder = torch.compile(decoder)
         self.add_module('encoder', encoder)
         self.add_module('decoder', decoder)
+        self._graph     = None
+        self._graph_in  = None
+        self._graph_out = None
+
+    def enable_cuda_graph(self, x, warmup=3):
+        """
+        Captures the forward pass in a CUDA graph
+
+        After capture, any forward call with an input of the same shape
+        replays the recorded graph, eliminating per-kernel launch overhead.
+        Inputs with a different shape fall back to the eager path
+
+        Parameters
+        ----------
+        x : Tensor
+            a sample input tensor, stored on a CUDA device
+        warmup : int (optional)
+            the number of warmup iterations before capture (default is 3)
+
+        Returns
+        -------
+        AutoEncoder
+            the autoencoder itself
+
+        Raises
+        ------
+        NotImplementedError
+            if the subclass overrides forward without a replay branch
+        """
+
+        if type(self).forward is not AutoEncoder.forward:
+            # a subclass forward (e.g. VariationalAutoEncoder) would never
+            # replay the captured graph, silently wasting the capture
+            raise NotImplementedError(
+                '{} overrides forward: capture its own graph instead of AutoEncoder\'s'.format(type(self).__name__))
+        assert x.is_cuda, 'CUDA graph capture requires a CUDA input tensor'
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(warmup):
+                self.decoder(self.encoder(x))
+        torch.cuda.current_stream().wait_stream(stream)
+        self._graph_in = x.clone()
+        self._graph    = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self._graph):
+            y     = self.encoder(self._graph_in)
+            x_hat = self.decoder(y)
+        self._graph_out = (x_hat, y)
+        return self
 
     def forward(self, x):
         """
@@ -50,6 +107,14 @@ class AutoEncoder(Model):
             the decoder and encoder output
         """
 
+        if self._graph is not None and x.is_cuda and x.shape == self._graph_in.shape and \
+                x.device == self._graph_in.device and \
+                not (torch.is_grad_enabled() and x.requires_grad):
+            # the replayed outputs carry no autograd history, so training
+            # steps and foreign-device inputs take the eager path instead
+            self._graph_in.copy_(x)
+            self._graph.replay()
+            return tuple(t.clone() for t in self._graph_out)
         y     = self.encoder(x)
         x_hat = self.decoder(y)
         return x_hat, y
@@ -61,12 +126,16 @@ def reconstruction_loss(x, x_hat, *args, **kwargs):
     """
     Returns the binary cross entropy loss
 
+    The decoder output is expected to be logits (no final sigmoid): the loss
+    is computed with binary_cross_entropy_with_logits, a single fused kernel
+    that is numerically stable near 0 and 1
+
     Parameters
     ----------
     x : Tensor
         the autoencoder input tensor
     x_hat : Tensor
-        the autoencoder output tensor
+        the autoencoder output logits tensor
 
     Returns
     -------
@@ -74,6 +143,6 @@ def reconstruction_loss(x, x_hat, *args, **kwargs):
         the (1,) loss tensor
     """
 
-    return torch.nn.BCELoss()(x_hat, x)
+    return torch.nn.functional.binary_cross_entropy_with_logits(x_hat, x, reduction='sum') / x.size(0)
 
 
@@ -1,4 +1,7 @@
-class Hook(object):
+import torch
+
+
+class Hook(torch.nn.Module):
     """
     A class representing a hook for PyTorch modules
 
@@ -23,7 +26,7 @@ class Hook(object):
         binds the hook to a given layer, unbinding it from the previous if needed
     unbind()
         unbinds the hook from the hooked layer
-    eval(layer, input, output)
+    _on_forward(layer, input, output)
         evaluates layerFcn, inputFcn and outputFcn over the bound layer
     """
 
@@ -43,9 +46,12 @@ class Hook(object):
             a name for the hook
         """
 
+        super(Hook, self).__init__()
         self.__handle  = None
         self.bind(layer)
-        self.layer     = layer
+        # the hooked layer is stored bypassing torch.nn.Module.__setattr__:
+        # it is owned by the observed network, not by the hook
+        object.__setattr__(self, 'layer', layer)
         self.layerFcn  = layerFcn
         self.inputFcn  = inputFcn
         self.outputFcn = outputFcn
@@ -84,8 +90,8 @@ class Hook(object):
         if layer is not None:
             if self.is_bound():
                 self.unbind()
-            self.layer    = layer
-            self.__handle = layer.register_forward_hook(self.eval)
+            object.__setattr__(self, 'layer', layer)
+            self.__handle = layer.register_forward_hook(self._on_forward)
         return self
 
     def unbind(self):
@@ -100,14 +106,17 @@ class Hook(object):
 
         if self.__handle is not None:
             self.__handle.remove()
-        self.layer    = None
+        object.__setattr__(self, 'layer', None)
         self.__handle = None
         return self
 
-    def eval(self, layer, input, output):
+    def _on_forward(self, layer, input, output):
         """
         Evaluates layerFcn, inputFcn and outputFcn over the bound layer
 
+        The callback is deliberately not called eval so that
+        torch.nn.Module.eval keeps its usual meaning on the hook
+
         Parameters
         ----------
         layer : torch.nn.Module
@@ -167,7 +176,7 @@ class DeferredHook(Hook):
         super(DeferredHook, self).__init__(*args, name=name, **kwargs)
         self.output = None
 
-    def eval(self, layer, input, output):
+    def _on_forward(self, layer, input, output):
         """
         Evaluates layerFcn, inputFcn and outputFcn over the bound layer, storing its input and output afterwards
 
@@ -185,5 +194,5 @@ class DeferredHook(Hook):
         None
         """
 
-        super(DeferredHook, self).eval(layer, input, output)
+        super(DeferredHook, self)._on_forward(layer, input, output)
         self.output = output
@@ -16,10 +16,9 @@ def mean_grad(model):
         the (1,) mean gradient tensor
     """
 
-    g = []
-    for p in model.parameters():
-        if p.grad is None:
-            g += [0]
-        else:
-            g += [p.grad.abs().mean()]
-    return torch.tensor(g, dtype=torch.float, device='cpu').mean()
+    grads = [p.grad for p in model.parameters() if p.grad is not None]
+    if not grads:
+        return torch.zeros((), dtype=torch.float, device='cpu')
+    total = torch.stack(torch._foreach_norm(grads, 1)).sum()
+    n     = sum(g.numel() for g in grads)
+    return (total / n).cpu()
@@ -1,6 +1,28 @@
 from .autoencoder import *
 
 
+@torch.jit.script
+def _reparameterize(mu, sigma):
+    """
+    Samples z = mu + exp(sigma/2)*eps in a single fused kernel
+
+    Parameters
+    ----------
+    mu : Tensor
+        the mean tensor
+    sigma : Tensor
+        the log variance tensor
+
+    Returns
+    -------
+    Tensor
+        the sampled z tensor
+    """
+
+    eps = torch.randn_like(mu)
+    return mu + torch.exp(sigma * 0.5) * eps
+
+
 class VariationalSampler(Model):
     """
     A class representing the sampler used in Variational AutoEncoders
@@ -60,9 +82,7 @@ class VariationalSampler(Model):
 
         mu    = self.mu(y)
         sigma = self.sigma(y)
-        eps   = torch.empty_like(mu, dtype=mu.dtype, device=self.device).normal_()
-        z     = mu + torch.exp(sigma/2)*eps
-        return z, mu, sigma
+        return _reparameterize(mu, sigma), mu, sigma
 
 
 class VariationalAutoEncoder(AutoEncoder):
@@ -77,6 +97,12 @@ class VariationalAutoEncoder(AutoEncoder):
     -------
     forward(x)
         returns the autoencoder output
+    encode(x)
+        returns the mean and standard deviation tensors of the input
+    decode(z)
+        returns the decoder output for the given latent tensor
+    sample(mu, sigma, n)
+        draws n latent samples from the given mean and standard deviation
     """
 
     def __init__(self, encoder, decoder, z_sampler=VariationalSampler(), name='VariationalAutoEncoder', **kwargs):
@@ -119,6 +145,91 @@ class VariationalAutoEncoder(AutoEncoder):
         x_hat        = self.decoder(z)
         return x_hat, mu, sigma
 
+    def encode(self, x):
+        """
+        Returns the mean and standard deviation tensors of the input
+
+        The encoder is run once and its output shared between the two heads,
+        so callers drawing several latent samples per input pay for a single
+        encoder pass
+
+        Parameters
+        ----------
+        x : Tensor
+            the autoencoder input
+
+        Returns
+        -------
+        (Tensor, Tensor)
+            the mean tensor and the standard deviation tensor
+        """
+
+        y = self.encoder(x)
+        return self.z_sampler.mu(y), self.z_sampler.sigma(y)
+
+    def decode(self, z):
+        """
+        Returns the decoder output for the given latent tensor
+
+        Parameters
+        ----------
+        z : Tensor
+            a latent tensor
+
+        Returns
+        -------
+        Tensor
+            the decoder output
+        """
+
+        return self.decoder(z)
+
+    def sample(self, mu, sigma, n=1):
+        """
+        Draws n latent samples from the given mean and standard deviation
+
+        Parameters
+        ----------
+        mu : Tensor
+            the mean tensor
+        sigma : Tensor
+            the standard deviation tensor
+        n : int (optional)
+            the number of samples to draw (default is 1)
+
+        Returns
+        -------
+        Tensor
+            the sampled z tensor if n is 1, a (n,...) stacked tensor otherwise
+        """
+
+        if n == 1:
+            return _reparameterize(mu, sigma)
+        return torch.stack([_reparameterize(mu, sigma) for _ in range(n)])
+
+
+@torch.jit.script
+def _kl(mu, sigma, beta: float):
+    """
+    Computes the KL divergence in a single fused reduction kernel
+
+    Parameters
+    ----------
+    mu : Tensor
+        the autoencoder mean tensor
+    sigma : Tensor
+        the autoencoder standard deviation tensor
+    beta : float
+        the disentanglement coefficient
+
+    Returns
+    -------
+    Tensor
+        the KL divergence tensor
+    """
+
+    return beta * 0.5 * torch.sum(mu * mu + torch.exp(sigma) - sigma - 1, 1).mean()
+
 
 def KL_divergence(mu, sigma, beta=1):
     """
@@ -137,7 +248,7 @@ def KL_divergence(mu, sigma, beta=1):
         the KL divergence tensor
     """
 
-    return beta * torch.mean(0.5 * torch.sum(mu**2 + torch.exp(sigma) - sigma - 1, 1))
+    return _kl(mu, sigma, float(beta))
 
 
 def VAELoss(x, x_hat, mu, sigma, beta=1):
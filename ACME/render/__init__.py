@@ -1,4 +1,5 @@
 from .camera            import *
+from .camera_batch      import *
 from .cameras           import *
 from .camera_intrinsics import *
 from .camera_extrinsics import *
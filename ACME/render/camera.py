@@ -5,6 +5,80 @@ from .camera_extrinsics import *
 from .camera_intrinsics import *
 
 
+_FUSED_PROJECT_THRESHOLD = 4096
+_FUSED_PROJECT_SOURCE    = r'''
+#include <ATen/cuda/CUDAContext.h>
+#include <c10/cuda/CUDAException.h>
+
+__global__ void project_fused_kernel(const float* __restrict__ P,
+                                     const float* __restrict__ M,
+                                     const float sx, const float sy, const float sz,
+                                     const long long N,
+                                     float* __restrict__ UVd)
+{
+    const long long i = blockIdx.x * (long long)blockDim.x + threadIdx.x;
+    if (i >= N) return;
+    const float px = P[i * 3], py = P[i * 3 + 1], pz = P[i * 3 + 2];
+    const float x  = M[ 0] * px + M[ 1] * py + M[ 2] * pz + M[ 3];
+    const float y  = M[ 4] * px + M[ 5] * py + M[ 6] * pz + M[ 7];
+    const float z  = M[ 8] * px + M[ 9] * py + M[10] * pz + M[11];
+    const float w  = M[12] * px + M[13] * py + M[14] * pz + M[15];
+    const float iw = 1.0f / w;
+    UVd[i * 3]     = x * iw * sx + sx;
+    UVd[i * 3 + 1] = y * iw * sy + sy;
+    UVd[i * 3 + 2] = z * iw * sz + sz;
+}
+
+torch::Tensor project_fused(torch::Tensor P, torch::Tensor M,
+                            double sx, double sy, double sz)
+{
+    auto Pc  = P.contiguous();
+    auto Mc  = M.contiguous();
+    auto UVd = torch::empty_like(Pc);
+    const long long N = Pc.size(0);
+    const int threads = 256;
+    const long long blocks = (N + threads - 1) / threads;
+    project_fused_kernel<<<blocks, threads, 0, at::cuda::getCurrentCUDAStream()>>>(
+        Pc.data_ptr<float>(), Mc.data_ptr<float>(),
+        (float)sx, (float)sy, (float)sz, N, UVd.data_ptr<float>());
+    C10_CUDA_KERNEL_LAUNCH_CHECK();
+    return UVd;
+}
+'''
+_fused_project_module = None
+
+
+def _fused_project():
+    """
+    Returns the fused CUDA projection extension, or None if unavailable
+
+    The extension fuses homogeneous lift, matmul, perspective divide and
+    pixel scaling into a single kernel, so a points tensor is read from and
+    written to memory exactly once. The kernel records no autograd history,
+    so callers must only dispatch to it when gradients are not required.
+    It is compiled lazily on first use; any build failure falls back to the
+    eager implementation for good
+
+    Returns
+    -------
+    module or None
+        the compiled extension, or None when it cannot be built
+    """
+
+    global _fused_project_module
+    if _fused_project_module is None:
+        try:
+            from torch.utils.cpp_extension import load_inline
+            _fused_project_module = load_inline(
+                name='acme_project_fused',
+                cpp_sources='torch::Tensor project_fused(torch::Tensor P, torch::Tensor M, double sx, double sy, double sz);',
+                cuda_sources=_FUSED_PROJECT_SOURCE,
+                functions=['project_fused'])
+        except Exception:
+            _fused_project_module = False
+    return _fused_project_module or None
+
+
 class Camera(object):
     """
     A class representing a camera
@@ -51,8 +125,67 @@ class Camera(object):
         self.intrinsic = intrinsic
         self.name      = name
         self.device    = device
+        self._pv       = None
+        self._pv_inv   = None
+
+    def _pv_key(self):
+        """
+        Returns the cache key identifying the current extrinsic/intrinsic state
+
+        Replacing the extrinsic or the intrinsic object altogether clears
+        the cached matrices directly in __setattr__, so the version
+        counters alone identify the state
+
+        Returns
+        -------
+        tuple
+            the cache key
+        """
 
-    def project(self, P, pixels=True, dim=-1):
+        return (getattr(self.extrinsic, '_version', 0),
+                getattr(self.intrinsic, '_version', 0))
+
+    def _pv_matrix(self):
+        """
+        Returns the composed projection * view matrix
+
+        The matrix is cached and only recomputed when the extrinsic or the
+        intrinsic mutates
+
+        Returns
+        -------
+        Tensor
+            a (4,4,) matrix
+        """
+
+        key = self._pv_key()
+        if self._pv is None or self._pv[0] != key:
+            self._pv = (key, torch.matmul(self.intrinsic.projection_matrix(),
+                                          self.extrinsic.view_matrix()))
+        return self._pv[1]
+
+    def _pv_inv_matrix(self):
+        """
+        Returns the inverse of the composed projection * view matrix
+
+        The inverse is composed from the analytic inverses of the view and
+        projection matrices, avoiding a general 4x4 inverse. The matrix is
+        cached and only recomputed when the extrinsic or the intrinsic
+        mutates
+
+        Returns
+        -------
+        Tensor
+            a (4,4,) matrix
+        """
+
+        key = self._pv_key()
+        if self._pv_inv is None or self._pv_inv[0] != key:
+            self._pv_inv = (key, torch.matmul(self.extrinsic.view_matrix_inv(),
+                                              self.intrinsic.projection_matrix_inv()))
+        return self._pv_inv[1]
+
+    def project(self, P, pixels=True, dim=-1, dtype=torch.float):
         """
         Projects the given 3D points into the 2D image
 
@@ -62,6 +195,10 @@ class Camera(object):
             a (N,3,) points set tensor
         pixels : bool (optional)
             if True the UVs are returned in floating point pixel coordinates
+        dtype : type (optional)
+            the dtype the transform is computed in (default is torch.float).
+            torch.bfloat16 halves the memory traffic of the matmul; the
+            result is cast back to float for the pixel scaling
 
         Returns
         -------
@@ -69,21 +206,28 @@ class Camera(object):
             a (N,3,) tensor containing UVs and depth
         """
 
-        s = 0.5
+        if P.is_cuda and P.ndimension() == 2 and P.size(1) == 3 and dim in (-1, 1) and \
+                P.dtype == torch.float and dtype == torch.float and \
+                P.numel() > _FUSED_PROJECT_THRESHOLD and \
+                not (torch.is_grad_enabled() and P.requires_grad):
+            ext = _fused_project()
+            if ext is not None:
+                if pixels:
+                    sx = (self.intrinsic.image_size[0] - 1) * 0.5
+                    sy = (self.intrinsic.image_size[1] - 1) * 0.5
+                else:
+                    sx = sy = 0.5
+                return ext.project_fused(P, self._pv_matrix(), sx, sy, 0.5)
         if pixels:
-            # Image width and height
-            w = self.intrinsic.image_size[0] - 1
-            h = self.intrinsic.image_size[1] - 1
-            t = torch.ones(P.ndimension(), dtype=torch.long, device=P.device)
-            t[dim] = -1
             # Normalization factor (bring the coordinates from [-1,1] to [0, w], [0, h] and [0, 1] respectively)
-            s *= torch.tensor([w, h, 1], dtype=torch.float, device=self.device).view(*t)
+            s = self.intrinsic.pixel_scale(P.ndimension(), dim)
+        else:
+            s = 0.5
         # Transform the points into homogeneous coordinates, transform them into camera space and then project them
-        UVd = torch.matmul(cart2homo(P, w=1, dim=dim),
-                           torch.transpose(torch.matmul(self.intrinsic.projection_matrix(),
-                                                        self.extrinsic.view_matrix()),
-                                           -1, -2)
-                           )
+        UVd = torch.matmul(cart2homo(P, w=1, dim=dim).to(dtype),
+                           torch.transpose(self._pv_matrix(), -1, -2).to(dtype))
+        if dtype != torch.float:
+            UVd = UVd.to(torch.float)
         # Bring the points into normalized homogeneous coordinates and normalize their values
         return homo2cart(UVd, dim=dim) * s + s
 
@@ -109,14 +253,13 @@ class Camera(object):
             # Image width and height
             w = self.intrinsic.image_size[0] - 1
             h = self.intrinsic.image_size[1] - 1
-            t = torch.ones(UVd.ndimension(), dtype=torch.long, device=UVd.device)
-            t[dim] = -1
+            shape      = [1] * UVd.ndimension()
+            shape[dim] = -1
             # Normalization factor (brings the coordinates to [-1, 1])
-            s /= torch.tensor([w, h, 1], dtype=torch.float, device=self.device).view(*t)
+            s /= torch.tensor([w, h, 1], dtype=torch.float, device=self.device).view(shape)
         # Change the points domain, transform them into homogeneous, and invert the projection process
         P = torch.matmul(cart2homo(UVd * s - 1, w=1, dim=dim),
-                         torch.inverse(torch.matmul(self.intrinsic.projection_matrix(),
-                                                    self.extrinsic.view_matrix())))
+                         torch.transpose(self._pv_inv_matrix(), -1, -2))
         # Normalize the coordinates
         return homo2cart(P, dim=dim)
 
@@ -141,7 +284,15 @@ class Camera(object):
         return self
 
     def __setattr__(self, key, value):
+        if key == 'device' and 'device' in self.__dict__ and \
+                torch.device(value) == torch.device(self.__dict__['device']):
+            # same device: skip re-propagating to extrinsic and intrinsic
+            self.__dict__[key] = value
+            return
         self.__dict__[key] = value
+        if key in ('extrinsic', 'intrinsic'):
+            self.__dict__['_pv']     = None
+            self.__dict__['_pv_inv'] = None
         if key == 'device':
             self.extrinsic.to(device=self.device)
             self.intrinsic.to(device=self.device)
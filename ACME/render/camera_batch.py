@@ -0,0 +1,336 @@
+import torch
+from ..math.cart2homo import *
+from ..math.homo2cart import *
+
+
+class CameraBatch(object):
+    """
+    A class representing a batch of B cameras in structure-of-arrays form
+
+    All cameras are transformed at once: view and projection matrices are
+    built as (B,4,4,) tensors with no Python loop, and projecting N points
+    through all cameras is a single batched matmul instead of B separate
+    calls. Points coordinates always lie on the last dimension.
+
+    Attributes
+    ----------
+    position : Tensor
+        the (B,3,) camera positions
+    target : Tensor
+        the (B,3,) camera targets
+    up_vector : Tensor
+        the (B,3,) camera up vectors
+    fov : Tensor
+        the (B,) field of view angles in degrees
+    near : Tensor
+        the (B,) near clipping plane distances
+    far : Tensor
+        the (B,) far clipping plane distances
+    image_size : Tensor
+        the (B,2,) image sizes
+    projection : str
+        the camera projection type ('orthographic' or 'perspective')
+    device : str or torch.device
+        the device to store the tensors to
+
+    Methods
+    -------
+    size()
+        returns the number of cameras in the batch
+    view_matrix()
+        returns the current view matrices
+    projection_matrix()
+        returns the current projection matrices
+    pv()
+        returns the composed projection * view matrices
+    project(P)
+        projects the given 3D points into the 2D images
+    unproject(UVd)
+        unprojects the given 2D points + depth to 3D space
+    to(**kwargs)
+        changes the batch dtype and/or device
+    """
+
+    def __init__(self, position, target, up_vector=(0, 1, 0),
+                 fov=30, near=0.1, far=10, image_size=(256, 256),
+                 projection='perspective', device='cuda:0'):
+        """
+        Parameters
+        ----------
+        position : Tensor
+            the (B,3,) camera positions
+        target : Tensor or list or tuple
+            the (B,3,) or (3,) camera targets
+        up_vector : Tensor or list or tuple (optional)
+            the (B,3,) or (3,) camera up vectors (default is (0, 1, 0))
+        fov : Tensor or float (optional)
+            the (B,) or scalar field of view in degrees (default is 30)
+        near : Tensor or float (optional)
+            the (B,) or scalar near clipping plane distance (default is 0.1)
+        far : Tensor or float (optional)
+            the (B,) or scalar far clipping plane distance (default is 10)
+        image_size : Tensor or list or tuple (optional)
+            the (B,2,) or (2,) image sizes (default is (256, 256))
+        projection : str (optional)
+            the projection type (default is 'perspective')
+        device : str or torch.device (optional)
+            the device to store the tensors to (default is 'cuda:0')
+        """
+
+        object.__setattr__(self, '_cache', {})
+        B = position.shape[0]
+        self.position   = torch.as_tensor(position,   dtype=torch.float, device=device)
+        self.target     = torch.as_tensor(target,     dtype=torch.float, device=device).expand(B, 3).contiguous()
+        self.up_vector  = torch.as_tensor(up_vector,  dtype=torch.float, device=device).expand(B, 3).contiguous()
+        self.fov        = torch.as_tensor(fov,        dtype=torch.float, device=device).expand(B).contiguous()
+        self.near       = torch.as_tensor(near,       dtype=torch.float, device=device).expand(B).contiguous()
+        self.far        = torch.as_tensor(far,        dtype=torch.float, device=device).expand(B).contiguous()
+        self.image_size = torch.as_tensor(image_size, dtype=torch.float, device=device).expand(B, 2).contiguous()
+        self.projection = projection
+        self._device    = device
+
+    @classmethod
+    def from_cameras(cls, *camera):
+        """
+        Builds a batch from the given cameras
+
+        Parameters
+        ----------
+        camera : Camera...
+            the cameras to batch together
+
+        Returns
+        -------
+        CameraBatch
+            the camera batch
+        """
+
+        e = [c.extrinsic for c in camera]
+        i = [c.intrinsic for c in camera]
+        return cls(position=torch.stack([x.position for x in e]),
+                   target=torch.stack([x.target for x in e]),
+                   up_vector=torch.stack([x.up_vector for x in e]),
+                   fov=torch.tensor([x.fov for x in i], dtype=torch.float, device=e[0].device),
+                   near=torch.tensor([x.near for x in i], dtype=torch.float, device=e[0].device),
+                   far=torch.tensor([x.far for x in i], dtype=torch.float, device=e[0].device),
+                   image_size=torch.tensor([list(x.image_size) for x in i], dtype=torch.float, device=e[0].device),
+                   projection=i[0].projection,
+                   device=e[0].device)
+
+    def size(self):
+        """
+        Returns the number of cameras in the batch
+
+        Returns
+        -------
+        int
+            the number of cameras
+        """
+
+        return self.position.shape[0]
+
+    def view_matrix(self):
+        """
+        Returns the current view matrices
+
+        The matrices are cached and only rebuilt when one of the extrinsic
+        parameters changes
+
+        Returns
+        -------
+        Tensor
+            a (B,4,4,) view matrices tensor
+        """
+
+        M = self._cache.get('view')
+        if M is not None:
+            return M
+        z = torch.nn.functional.normalize(self.target - self.position, dim=-1)
+        x = torch.nn.functional.normalize(torch.linalg.cross(self.up_vector, z, dim=-1), dim=-1)
+        y = torch.linalg.cross(z, x, dim=-1)
+        M = torch.zeros(self.size(), 4, 4, dtype=torch.float, device=self.device)
+        M[:, :3, 0] = x
+        M[:, :3, 1] = y
+        M[:, :3, 2] = z
+        M[:, :3, 3] = -self.position
+        M[:, 3, 3]  = 1
+        self._cache['view'] = M
+        return M
+
+    def projection_matrix(self):
+        """
+        Returns the current projection matrices
+
+        The matrices are cached and only rebuilt when one of the intrinsic
+        parameters changes
+
+        Returns
+        -------
+        Tensor
+            a (B,4,4,) projection matrices tensor
+
+        Raises
+        ------
+        ValueError
+            if the projection type is unknown
+        """
+
+        M = self._cache.get('projection')
+        if M is not None:
+            return M
+        t = torch.tan(torch.deg2rad(self.fov) / 2)
+        a = self.image_size[:, 0] / self.image_size[:, 1]
+        M = torch.zeros(self.size(), 4, 4, dtype=torch.float, device=self.device)
+        M[:, 0, 0] = 1 / (a * t)
+        M[:, 1, 1] = 1 / t
+        if self.projection == 'orthographic':
+            M[:, 2, 2] = 2 / (self.far - self.near)
+            M[:, 2, 3] = -(self.far + self.near) / (self.far - self.near)
+            M[:, 3, 3] = 1
+        elif self.projection == 'perspective':
+            M[:, 2, 2] = (self.far + self.near) / (self.far - self.near)
+            M[:, 2, 3] = -2 * (self.far * self.near) / (self.far - self.near)
+            M[:, 3, 2] = 1
+        else:
+            raise ValueError('Unknown projection type.')
+        self._cache['projection'] = M
+        return M
+
+    def pv(self):
+        """
+        Returns the composed projection * view matrices
+
+        The matrices are cached and only rebuilt when one of the camera
+        parameters changes
+
+        Returns
+        -------
+        Tensor
+            a (B,4,4,) matrices tensor
+        """
+
+        M = self._cache.get('pv')
+        if M is None:
+            M = torch.matmul(self.projection_matrix(), self.view_matrix())
+            self._cache['pv'] = M
+        return M
+
+    def pv_inv(self):
+        """
+        Returns the inverse of the composed projection * view matrices
+
+        The matrices are cached and only rebuilt when one of the camera
+        parameters changes
+
+        Returns
+        -------
+        Tensor
+            a (B,4,4,) matrices tensor
+        """
+
+        M = self._cache.get('pv_inv')
+        if M is None:
+            M = torch.inverse(self.pv())
+            self._cache['pv_inv'] = M
+        return M
+
+    def project(self, P, pixels=True):
+        """
+        Projects the given 3D points into the 2D images
+
+        Parameters
+        ----------
+        P : Tensor
+            a (N,3,) or (B,N,3,) points set tensor
+        pixels : bool (optional)
+            if True the UVs are returned in floating point pixel coordinates
+
+        Returns
+        -------
+        Tensor
+            a (B,N,3,) tensor containing UVs and depth
+        """
+
+        s = 0.5
+        if pixels:
+            # Normalization factor (bring the coordinates from [-1,1] to [0, w], [0, h] and [0, 1] respectively)
+            s *= torch.cat((self.image_size - 1,
+                            torch.ones(self.size(), 1, dtype=torch.float, device=self.device)),
+                           dim=1).unsqueeze(1)
+        # Transform the points into homogeneous coordinates and project them through all cameras at once
+        UVd = torch.matmul(cart2homo(P, w=1, dim=-1),
+                           torch.transpose(self.pv(), -1, -2))
+        # Bring the points into normalized homogeneous coordinates and normalize their values
+        return homo2cart(UVd, dim=-1) * s + s
+
+    def unproject(self, UVd, pixels=True):
+        """
+        Unprojects the given 2D points + depth to 3D space
+
+        Parameters
+        ----------
+        UVd : Tensor
+            a (N,3,) or (B,N,3,) points set tensor consisting of UVs and depth values
+        pixels : bool (optional)
+            if True, the UVs are treated as floating point pixel coordinates
+
+        Returns
+        -------
+        Tensor
+            a (B,N,3,) points set tensor
+        """
+
+        s = 2
+        if pixels:
+            # Normalization factor (brings the coordinates to [-1, 1])
+            s /= torch.cat((self.image_size - 1,
+                            torch.ones(self.size(), 1, dtype=torch.float, device=self.device)),
+                           dim=1).unsqueeze(1)
+        # Change the points domain, transform them into homogeneous, and invert the projection process
+        P = torch.matmul(cart2homo(UVd * s - 1, w=1, dim=-1),
+                         torch.transpose(self.pv_inv(), -1, -2))
+        # Normalize the coordinates
+        return homo2cart(P, dim=-1)
+
+    def to(self, **kwargs):
+        """
+        Changes the batch dtype and/or device
+
+        Parameters
+        ----------
+        kwargs : ...
+
+        Returns
+        -------
+        CameraBatch
+            the batch itself
+        """
+
+        if 'device' in kwargs:
+            self._device = kwargs['device']
+        self.position   = self.position.to(**kwargs)
+        self.target     = self.target.to(**kwargs)
+        self.up_vector  = self.up_vector.to(**kwargs)
+        self.fov        = self.fov.to(**kwargs)
+        self.near       = self.near.to(**kwargs)
+        self.far        = self.far.to(**kwargs)
+        self.image_size = self.image_size.to(**kwargs)
+        return self
+
+    @property
+    def device(self):
+        return self._device
+
+    @device.setter
+    def device(self, value):
+        self._device = value
+        self.to(device=value)
+
+    def __len__(self):
+        return self.size()
+
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+        if key in ('position', 'target', 'up_vector',
+                   'fov', 'near', 'far', 'image_size', 'projection', '_device'):
+            self._cache.clear()
@@ -1,6 +1,39 @@
 import torch
-from ..math.cross   import *
-from ..math.normvec import *
+
+
+@torch.jit.script
+def _view_matrix(position, target, up_vector):
+    """
+    Builds a view matrix from the given camera vectors
+
+    The function is scripted so the small tensor ops fuse into a single
+    graph with no per-op Python overhead
+
+    Parameters
+    ----------
+    position : Tensor
+        the (3,) camera position
+    target : Tensor
+        the (3,) camera target
+    up_vector : Tensor
+        the (3,) camera up vector
+
+    Returns
+    -------
+    Tensor
+        a (4,4,) view matrix
+    """
+
+    z = torch.nn.functional.normalize(target - position, dim=-1)
+    x = torch.nn.functional.normalize(torch.linalg.cross(up_vector, z, dim=-1), dim=-1)
+    y = torch.linalg.cross(z, x, dim=-1)
+    M = torch.zeros(4, 4, dtype=torch.float, device=position.device)
+    M[:3, 0] = x
+    M[:3, 1] = y
+    M[:3, 2] = z
+    M[:3, 3] = -position
+    M[3, 3]  = 1
+    return M
 
 
 class CameraExtrinsic(object):
@@ -46,6 +79,7 @@ class CameraExtrinsic(object):
             the device to store the tensors to (default is 'cuda:0')
         """
 
+        object.__setattr__(self, '_cache', {})
         self.position  = torch.tensor(position,  dtype=torch.float, device=device)
         self.target    = torch.tensor(target,    dtype=torch.float, device=device)
         self.up_vector = torch.tensor(up_vector, dtype=torch.float, device=device)
@@ -103,19 +137,45 @@ class CameraExtrinsic(object):
         """
         Returns the current view matrix
 
+        The matrix is cached and only rebuilt when position, target, up vector
+        or device change
+
         Returns
         -------
         Tensor
             a (4,4,) view matrix
         """
 
-        z = normr(self.direction().unsqueeze(0))
-        x = normr(cross(self.up_vector.unsqueeze(0), z))
-        y = cross(z, x)
-        p = self.position.unsqueeze(0)
-        M = torch.cat((torch.cat((x.t(), y.t(), z.t(), -p.t()), dim=1),
-                       torch.tensor([[0, 0, 0, 1]], dtype=torch.float, device=self.device)),
-                      dim=0)
+        M = self._cache.get('view')
+        if M is None:
+            M = _view_matrix(self.position, self.target, self.up_vector)
+            self._cache['view'] = M
+        return M
+
+    def view_matrix_inv(self):
+        """
+        Returns the inverse of the current view matrix
+
+        Since the rotation block is orthonormal the inverse is written in
+        closed form as [[R.T, R.T @ p], [0, 1]], avoiding a general 4x4
+        inverse. It is cached and only rebuilt when position, target, up
+        vector or device change
+
+        Returns
+        -------
+        Tensor
+            a (4,4,) matrix
+        """
+
+        M = self._cache.get('view_inv')
+        if M is not None:
+            return M
+        R = self.view_matrix()[:3, :3]
+        M = torch.zeros(4, 4, dtype=torch.float, device=self.device)
+        M[:3, :3] = torch.t(R)
+        M[:3, 3]  = torch.mv(torch.t(R), self.position)
+        M[3, 3]   = 1
+        self._cache['view_inv'] = M
         return M
 
     def to(self, **kwargs):
@@ -133,7 +193,13 @@ class CameraExtrinsic(object):
         """
 
         if 'device' in kwargs:
-            self._device = kwargs['device']
+            if torch.device(kwargs['device']) == torch.device(self._device):
+                # same device: drop the no-op move so the cache survives
+                kwargs = {k: v for k, v in kwargs.items() if k != 'device'}
+                if not kwargs:
+                    return self
+            else:
+                self._device = kwargs['device']
         self.position  = self.position.to(**kwargs)
         self.target    = self.target.to(**kwargs)
         self.up_vector = self.up_vector.to(**kwargs)
@@ -145,7 +211,15 @@ class CameraExtrinsic(object):
 
     @device.setter
     def device(self, value):
-        self._device    = value
+        if torch.device(value) == torch.device(self._device):
+            return
+        self._device   = value
         self.position  = self.position.to(self.device)
         self.target    = self.target.to(self.device)
         self.up_vector = self.up_vector.to(self.device)
+
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+        if key in ('position', 'target', 'up_vector', '_device'):
+            self._cache.clear()
+            object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
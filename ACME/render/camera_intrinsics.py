@@ -1,6 +1,5 @@
+import math
 import torch
-from ..math.deg2rad import *
-from ..math.tan     import *
 
 
 class CameraIntrinsic(object):
@@ -54,6 +53,7 @@ class CameraIntrinsic(object):
             the device to store the tensors to (default is 'cuda:0')
         """
 
+        object.__setattr__(self, '_cache', {})
         self.fov        = fov
         self.near       = near
         self.far        = far
@@ -76,17 +76,25 @@ class CameraIntrinsic(object):
         """
         Returns the current projection matrix
 
+        The matrix is cached and only rebuilt when one of the intrinsic
+        parameters changes
+
         Returns
         -------
         Tensor
             a (4,4,) projection matrix
         """
 
-        if self.projection == 'orthographic':
-            return self.orthographic_matrix()
-        if self.projection == 'perspective':
-            return self.perspective_matrix()
-        raise ValueError('Unknown projection type.')
+        M = self._cache.get('projection')
+        if M is None:
+            if self.projection == 'orthographic':
+                M = self.orthographic_matrix()
+            elif self.projection == 'perspective':
+                M = self.perspective_matrix()
+            else:
+                raise ValueError('Unknown projection type.')
+            self._cache['projection'] = M
+        return M
 
     def orthographic_matrix(self):
         """
@@ -98,14 +106,12 @@ class CameraIntrinsic(object):
             a (4,4,) projection matrix
         """
 
-        fov = deg2rad(self.fov)
-        M = torch.zeros(4, 4, device=self.device)
-        M[0, 0] = 1 / (self.aspect() * tan(fov / 2))
-        M[1, 1] = 1 / tan(fov / 2)
-        M[2, 2] = 2 / (self.far - self.near)
-        M[2, 3] = -(self.far + self.near) / (self.far - self.near)
-        M[3, 3] = 1
-        return M
+        t = math.tan(math.radians(self.fov) / 2)
+        M = torch.tensor([[1 / (self.aspect() * t), 0, 0, 0],
+                          [0, 1 / t, 0, 0],
+                          [0, 0, 2 / (self.far - self.near), -(self.far + self.near) / (self.far - self.near)],
+                          [0, 0, 0, 1]], dtype=torch.float)
+        return M.to(self.device, non_blocking=True)
 
     def perspective_matrix(self):
         """
@@ -117,13 +123,87 @@ class CameraIntrinsic(object):
             a (4,4,) projection matrix
         """
 
-        fov = deg2rad(self.fov)
-        M = torch.zeros(4, 4, device=self.device)
-        M[0, 0] = 1 / (self.aspect() * tan(fov / 2))
-        M[1, 1] = 1 / tan(fov / 2)
-        M[2, 2] = (self.far + self.near) / (self.far - self.near)
-        M[2, 3] = -2 * (self.far * self.near) / (self.far - self.near)
-        M[3, 2] = 1
+        t = math.tan(math.radians(self.fov) / 2)
+        M = torch.tensor([[1 / (self.aspect() * t), 0, 0, 0],
+                          [0, 1 / t, 0, 0],
+                          [0, 0, (self.far + self.near) / (self.far - self.near), -2 * (self.far * self.near) / (self.far - self.near)],
+                          [0, 0, 1, 0]], dtype=torch.float)
+        return M.to(self.device, non_blocking=True)
+
+    def pixel_scale(self, ndim, dim=-1):
+        """
+        Returns the pixel normalization factor used by the camera projection
+
+        The tensor is half the [w-1, h-1, 1] image extents, shaped to
+        broadcast along the given dimension of a ndim dimensional tensor.
+        It is cached and only rebuilt when image size or device change
+
+        Parameters
+        ----------
+        ndim : int
+            the number of dimensions of the tensor to scale
+        dim : int (optional)
+            the dimension containing the coordinates (default is -1)
+
+        Returns
+        -------
+        Tensor
+            the pixel scale tensor
+        """
+
+        key = ('pixel_scale', ndim, dim)
+        s   = self._cache.get(key)
+        if s is None:
+            shape      = [1] * ndim
+            shape[dim] = -1
+            s = torch.tensor([self.image_size[0] - 1, self.image_size[1] - 1, 1],
+                             dtype=torch.float).mul_(0.5).view(shape)
+            s = s.to(self.device, non_blocking=True)
+            self._cache[key] = s
+        return s
+
+    def projection_matrix_inv(self):
+        """
+        Returns the inverse of the current projection matrix
+
+        The inverse is written in closed form from the sparse structure of
+        the projection matrices, avoiding a general 4x4 inverse. It is
+        cached and only rebuilt when one of the intrinsic parameters changes
+
+        Returns
+        -------
+        Tensor
+            a (4,4,) matrix
+
+        Raises
+        ------
+        ValueError
+            if the projection type is unknown
+        """
+
+        M = self._cache.get('projection_inv')
+        if M is None:
+            t = math.tan(math.radians(self.fov) / 2)
+            a = 1 / (self.aspect() * t)
+            b = 1 / t
+            if self.projection == 'orthographic':
+                c = 2 / (self.far - self.near)
+                d = -(self.far + self.near) / (self.far - self.near)
+                M = torch.tensor([[1 / a, 0, 0, 0],
+                                  [0, 1 / b, 0, 0],
+                                  [0, 0, 1 / c, -d / c],
+                                  [0, 0, 0, 1]], dtype=torch.float)
+            elif self.projection == 'perspective':
+                c = (self.far + self.near) / (self.far - self.near)
+                d = -2 * (self.far * self.near) / (self.far - self.near)
+                M = torch.tensor([[1 / a, 0, 0, 0],
+                                  [0, 1 / b, 0, 0],
+                                  [0, 0, 0, 1],
+                                  [0, 0, 1 / d, -c / d]], dtype=torch.float)
+            else:
+                raise ValueError('Unknown projection type.')
+            M = M.to(self.device, non_blocking=True)
+            self._cache['projection_inv'] = M
         return M
 
     def to(self, **kwargs):
@@ -143,3 +223,14 @@ class CameraIntrinsic(object):
         if 'device' in kwargs:
             self.device = kwargs['device']
         return self
+
+    def __setattr__(self, key, value):
+        if key == 'device' and 'device' in self.__dict__ and \
+                torch.device(value) == torch.device(self.__dict__['device']):
+            # same device: keep the cached tensors valid
+            object.__setattr__(self, key, value)
+            return
+        object.__setattr__(self, key, value)
+        if key in ('fov', 'near', 'far', 'image_size', 'projection', 'device'):
+            self._cache.clear()
+            object.__setattr__(self, '_version', getattr(self, '_version', 0) + 1)
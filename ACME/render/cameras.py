@@ -11,6 +11,37 @@ from ..math.cart2sph                import *
 from ..math.sph2rotm                import *
 
 
+_POLY_CACHE   = {}
+_R_TILT_CACHE = {}
+_STAGE_CACHE  = {}
+
+
+def _tilt_matrix(device):
+    """
+    Returns the constant camera stage tilt matrix, memoized per device
+
+    Parameters
+    ----------
+    device : str or torch.device
+        the device the tensor will be stored to
+
+    Returns
+    -------
+    Tensor
+        the (3,3,) rotation matrix
+    """
+
+    key = str(device)
+    R   = _R_TILT_CACHE.get(key)
+    if R is None:
+        theta = PI/100
+        R     = torch.tensor([[1, 0, 0],
+                              [0, cos(theta), -sin(theta)],
+                              [0, sin(theta), cos(theta)]], dtype=torch.float, device=device)
+        _R_TILT_CACHE[key] = R
+    return R
+
+
 def bokeh_camera(P, n=4, aperture=PI_16):
     """
     Creates a set of n positions around the given one
@@ -30,8 +61,14 @@ def bokeh_camera(P, n=4, aperture=PI_16):
         a (N+1,3,) tensor
     """
 
-    Q = torch.cat((torch.zeros_like(P), aperture*equilateral_polygon(n, device=P.device)), dim=0)
-    return sph2cart(cart2sph(P)+Q[:, (2, 0, 1)])
+    key = (n, str(P.device))
+    Q   = _POLY_CACHE.get(key)
+    if Q is None:
+        # constant polygon, stored contiguously in spherical component order
+        # so no per-call column permutation is needed
+        Q = equilateral_polygon(n, device=P.device)[:, (2, 0, 1)].contiguous()
+        _POLY_CACHE[key] = Q
+    return sph2cart(cart2sph(P) + torch.cat((torch.zeros_like(P), aperture * Q), dim=0))
 
 
 def camera_stage(tile=(6, 4), camera_distance=1, to_spherical=False, device='cuda:0'):
@@ -55,13 +92,9 @@ def camera_stage(tile=(6, 4), camera_distance=1, to_spherical=False, device='cud
         the positions and the edge tensor of the camera views
     """
 
-    P, T  = Sphere(tile=tile, device=device)[0:2]
-    P,T   = soup2mesh(P, T)[0:2]
-    theta = PI/100
-    R     = torch.tensor([[1, 0, 0],
-                          [0, cos(theta), -sin(theta)],
-                          [0, sin(theta), cos(theta)]], dtype=torch.float, device=device)
-    P     = torch.mul(torch.mm(P, torch.t(R)), camera_distance)
+    P, T = Sphere(tile=tile, device=device)[0:2]
+    P, T = soup2mesh(P, T)[0:2]
+    P    = torch.mul(torch.mm(P, torch.t(_tilt_matrix(device))), camera_distance)
     E = torch.cat((poly2edge(T)[0],
                    poly2edge(torch.cat((ind2edge(T[0], T[2]),
                                         ind2edge(T[1], T[3])), dim=1))[0]),
@@ -76,6 +109,9 @@ def camera_from_polyhedron(polyhedronFcn, camera_distance=1, to_spherical=False,
     """
     Returns the positions of a camera lying on the vertices of a given polyhedron
 
+    The result is memoized per (polyhedron, distance, to_spherical, device),
+    so repeated calls return clones of the cached tensors with no recompute
+
     Parameters
     ----------
     polyhedronFcn : callable
@@ -93,15 +129,17 @@ def camera_from_polyhedron(polyhedronFcn, camera_distance=1, to_spherical=False,
         the positions and the edge tensor of the camera views
     """
 
-    P, T  = polyhedronFcn(device=device)[0:2]
-    theta = PI/100
-    R     = torch.tensor([[1, 0, 0],
-                          [0, cos(theta), -sin(theta)],
-                          [0, sin(theta), cos(theta)]], dtype=torch.float, device=device)
-    P     = torch.mul(torch.mm(normr(P), torch.t(R)), camera_distance)
-    if to_spherical:
-        P = cart2sph(P)
-    return P, poly2edge(T)[0]
+    key = (polyhedronFcn.__name__, camera_distance, to_spherical, str(device))
+    out = _STAGE_CACHE.get(key)
+    if out is None:
+        P, T = polyhedronFcn(device=device)[0:2]
+        P    = torch.mul(torch.mm(normr(P), torch.t(_tilt_matrix(device))), camera_distance)
+        if to_spherical:
+            P = cart2sph(P)
+        out = (P.detach(), poly2edge(T)[0].detach())
+        _STAGE_CACHE[key] = out
+    # clone so callers can freely mutate the returned tensors
+    return out[0].clone(), out[1].clone()
 
 
 def camera_6(camera_distance=1, to_spherical=False, device='cuda:0'):
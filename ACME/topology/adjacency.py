@@ -1,10 +1,10 @@
 import torch
-from ..utility.col  import *
-from ..utility.find import *
-from .poly2edge     import *
+from ..utility.col      import *
+from ..utility.isscalar import *
+from .poly2edge         import *
 
 
-def adjacency(E, W, size=None):
+def adjacency(E, W=None, size=None, sparse=False):
     """
     Computes the adjacency matrix with the given weights for the specified edges
 
@@ -12,10 +12,17 @@ def adjacency(E, W, size=None):
     ----------
     E : LongTensor
         the (2,N,) edge topology tensor
-    W : Tensor
-        the (N,) edges weights tensor
-    size : tuple (optional)
-        the adjacency matrix size. If None it will be automatically computed (default is None)
+    W : Tensor (optional)
+        the (N,) edges weights tensor. If None unit weights are assumed,
+        using a bincount over the linearized indices with no weights tensor
+        allocation at all (default is None)
+    size : int or tuple (optional)
+        the adjacency matrix size. If None it is inferred from E.max(), which
+        forces a device synchronization on GPU tensors: callers in tight loops
+        should pass the known vertex count instead (default is None)
+    sparse : bool (optional)
+        if True returns a sparse COO adjacency matrix, using O(N) memory
+        instead of O(size^2) (default is False)
 
     Returns
     -------
@@ -24,15 +31,22 @@ def adjacency(E, W, size=None):
     """
 
     if size is None:
-        size = (E.max().item() + 1, ) * 2
+        size = (int(E.max().item()) + 1, ) * 2
+    if isscalar(size):
+        size = (size, size)
+    if sparse:
+        if W is None:
+            W = torch.ones(col(E), dtype=torch.float, device=E.device)
+        return torch.sparse_coo_tensor(E, W.squeeze(), tuple(size), device=W.device).coalesce()
+    if W is None:
+        lin = E[0] * size[1] + E[1]
+        return torch.bincount(lin, minlength=size[0] * size[1]).to(torch.float).view(size[0], size[1])
     A = torch.zeros(*size, dtype=W.dtype, device=W.device)
-    # A[tuple(E)] = W
-    for e, w in zip(torch.t(E), W.squeeze()):
-        A[tuple(e)] += w
+    A.index_put_((E[0], E[1]), W.squeeze(), accumulate=True)
     return A
 
 
-def edge2adj(E, size=None):
+def edge2adj(E, size=None, sparse=False):
     """
     Computes the adjacency matrix from the given edge tensor
 
@@ -41,7 +55,10 @@ def edge2adj(E, size=None):
     E : LongTensor
         the edge tensor
     size : int (optional)
-        the adjacency matrix size. If None it will be automatically computed (default is None)
+        the adjacency matrix size. If None it is inferred from E.max(), forcing
+        a device synchronization on GPU tensors (default is None)
+    sparse : bool (optional)
+        if True returns a sparse COO adjacency matrix (default is False)
 
     Returns
     -------
@@ -49,17 +66,20 @@ def edge2adj(E, size=None):
         the adjacency matrix
     """
 
-    return adjacency(E, torch.ones(col(E), dtype=torch.float, device=E.device), size=size)
+    return adjacency(E, size=size, sparse=sparse)
 
 
 def adj2edge(A):
     """
     Extracts the edges from an adjacency matrix.
 
+    Any entry with a non zero weight is considered an edge, so negatively
+    weighted edges (e.g. cotangent weights) are preserved
+
     Parameters
     ----------
     A : Tensor
-        the adjacency matrix
+        the adjacency matrix, either dense or sparse COO
 
     Returns
     -------
@@ -67,10 +87,12 @@ def adj2edge(A):
         the edge tensor
     """
 
-    return torch.t(find(A > 0, linear=False))
+    if A.is_sparse:
+        return A.coalesce().indices()
+    return A.to_sparse().indices()
 
 
-def poly2adj(T, size=None):
+def poly2adj(T, size=None, sparse=False):
     """
     Computes the adjacency matrix for the given topology
 
@@ -79,7 +101,10 @@ def poly2adj(T, size=None):
     T : LongTensor
         the topology tensor
     size : int (optional)
-        the adjacency matrix size. If None it will be automatically computed (default is None)
+        the adjacency matrix size. If None it is inferred from the topology,
+        forcing a device synchronization on GPU tensors (default is None)
+    sparse : bool (optional)
+        if True returns a sparse COO adjacency matrix (default is False)
 
     Returns
     -------
@@ -87,4 +112,4 @@ def poly2adj(T, size=None):
         the adjacency matrix
     """
 
-    return edge2adj(poly2edge(T)[0], size=size)
+    return edge2adj(poly2edge(T)[0], size=size, sparse=sparse)
@@ -1,3 +1,6 @@
+import queue
+import threading
+import torch
 from ..visdom.VisdomScene               import *
 from ..visdom.pie.TrainIterPiePlot      import *
 from ..visdom.line.LossPlot             import *
@@ -9,15 +12,23 @@ class VisdomObserver(TrainerObserver):
     """
     An observer created with a Visdom session
 
-    Automatically plots dataset processing stats, loss and gradient flow
+    Automatically plots dataset processing stats, loss and gradient flow.
+    Plot updates are network round-trips to the visdom server, so they are
+    pushed onto a queue consumed by a background thread: the training loop
+    never blocks on socket I/O. When the queue is full the oldest update is
+    dropped in favor of the newest. Gradient flow is only sampled every
+    grad_every iterations, with the statistics reduced in a single batched
+    pass and transferred to the CPU at once
 
     Attributes
     ----------
     scene : VisdomScene
         the visdom scene where to plot
+    grad_every : int
+        the number of iterations between two gradient flow samples
     """
 
-    def __init__(self, trainers=None, env='main'):
+    def __init__(self, trainers=None, env='main', grad_every=50):
         """
         Parameters
         ----------
@@ -25,13 +36,91 @@ class VisdomObserver(TrainerObserver):
             the trainer to observe
         env : str (optional)
             visdom environment (default is 'main')
+        grad_every : int (optional)
+            the number of iterations between two gradient flow samples
+            (default is 50)
         """
 
         super(VisdomObserver, self).__init__(trainers=trainers)
+        self.grad_every = grad_every
         self.scene = VisdomScene(env=env)
         self.scene.insert_plot(name='proc', cls=TrainIterPiePlot)
         self.scene.insert_plot(name='loss', cls=LossPlot)
         self.scene.insert_plot(name='grad', cls=GradientFlowLinePlot)
+        self._queue = queue.Queue(maxsize=1024)
+        threading.Thread(target=self._worker, daemon=True).start()
+
+    def _worker(self):
+        """
+        Consumes the update queue, forwarding each entry to the scene
+
+        Returns
+        -------
+        None
+        """
+
+        while True:
+            name, args = self._queue.get()
+            try:
+                self.scene.update_plot(name, *args)
+            except Exception:
+                # a failed plot update must not kill the worker
+                pass
+            self._queue.task_done()
+
+    def _enqueue(self, name, *args):
+        """
+        Enqueues a plot update, dropping the oldest entry when full
+
+        Parameters
+        ----------
+        name : str
+            the plot name
+        args : ...
+            the plot update arguments
+
+        Returns
+        -------
+        None
+        """
+
+        while True:
+            try:
+                self._queue.put_nowait((name, args))
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def _grad_flow(self, model):
+        """
+        Extracts the gradient flow of the given model in a single batched pass
+
+        The absolute values are computed with one foreach op over all
+        gradients and the resulting scalars reach the CPU with a single
+        transfer, instead of one sync per layer
+
+        Parameters
+        ----------
+        model : torch.nn.Module
+            the model to extract the gradient flow from
+
+        Returns
+        -------
+        dict
+            a dictionary with the key being the layer name and its value being the layer gradient mean
+        """
+
+        d = {n: p.grad for n, p in model.named_parameters()
+             if p.requires_grad and 'bias' not in n}
+        g = [t for t in d.values() if t is not None]
+        if not g:
+            return {n: 0 for n in d}
+        v = iter(torch.stack([m.mean() for m in torch._foreach_abs(g)]).cpu().tolist())
+        return {n: (next(v) if t is not None else 0) for n, t in d.items()}
 
     def stateFcn(self, name, model, input, output, loss, epoch, iteration, t):
         """
@@ -61,7 +150,8 @@ class VisdomObserver(TrainerObserver):
         None
         """
 
-        self.scene.update_plot('proc', epoch, iteration, t)
-        self.scene.update_plot('loss', loss)
-        self.scene.update_plot('grad', model)
+        self._enqueue('proc', epoch, iteration, t)
+        self._enqueue('loss', loss)
+        if iteration[0] % self.grad_every == 0:
+            self._enqueue('grad', self._grad_flow(model))
         super(VisdomObserver, self).stateFcn(name, model, input, output, loss, epoch, iteration, t)
@@ -18,4 +18,6 @@ def find(cond, linear=True):
         a list of indices or a (ndim(cond),true values,) tensor containing the subscripts
     """
 
-    return torch.nonzero(cond.flatten()).flatten() if linear else torch.nonzero(cond)
+    if linear:
+        return torch.nonzero(cond.flatten(), as_tuple=False).squeeze(1)
+    return torch.nonzero(cond, as_tuple=False)
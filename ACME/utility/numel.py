@@ -1,4 +1,5 @@
 from .isscalar import *
+from .istorch  import *
 from .size     import *
 from .prod     import *
 
@@ -17,6 +18,8 @@ def numel(A):
         the number of elements in the given tensor
     """
 
+    if istorch(A):
+        return A.numel()
     s = size(A)
     if isscalar(s):
         return 1
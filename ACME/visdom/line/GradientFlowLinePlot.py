@@ -28,15 +28,16 @@ class GradientFlowLinePlot(LinePlot):
 
         Parameters
         ----------
-        model : torch.nn.Module
-            a model to plot the gradient flow from
+        model : torch.nn.Module or dict
+            a model to plot the gradient flow from, or an already extracted
+            {layer name: gradient mean} dictionary
 
         Returns
         -------
         None
         """
 
-        g = grad_flow(model)
+        g = model if isinstance(model, dict) else grad_flow(model)
         x = [i for i in range(len(g))]
         y = [v for v in g.values()]
         super(GradientFlowLinePlot, self).__update__(name='grad', x=x, y=y, legend='Grad', hovertext=list(g.keys()))